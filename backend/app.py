@@ -10,46 +10,309 @@ the `frontend` directory.
 from __future__ import annotations
 
 import calendar
+import hashlib
+import heapq
 import math
+import re
 import statistics
-from collections import Counter, deque
-from concurrent.futures import ThreadPoolExecutor, as_completed
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, as_completed, wait
+from concurrent.futures import TimeoutError as FuturesTimeoutError
 from datetime import date, timedelta
-from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+from functools import lru_cache, partial, wraps
+from itertools import combinations
+from typing import AbstractSet, Any, Callable, Dict, Hashable, Iterable, List, Optional, Tuple
 
-from flask import Flask, jsonify, request
+from flask import Flask, Response, jsonify, request
+from flask.json.provider import DefaultJSONProvider
 from flask_cors import CORS
+import orjson
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from openalex_offline import OFFLINE_DATA
 
+
+class OrjsonProvider(DefaultJSONProvider):
+    """Flask JSON provider that encodes and decodes with orjson."""
+
+    def _options(self, indent: bool) -> int:
+        return orjson.OPT_INDENT_2 if indent else 0
+
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        option = self._options(bool(kwargs.get("indent")))
+        return orjson.dumps(obj, default=self.default, option=option).decode()
+
+    def loads(self, s: str | bytes, **kwargs: Any) -> Any:
+        return orjson.loads(s)
+
+    def response(self, *args: Any, **kwargs: Any) -> Response:
+        # Hand orjson's bytes straight to the response instead of going
+        # through dumps() and re-encoding the str.
+        obj = self._prepare_response_obj(args, kwargs)
+        indent = (self.compact is None and self._app.debug) or self.compact is False
+        body = orjson.dumps(
+            obj,
+            default=self.default,
+            option=self._options(bool(indent)) | orjson.OPT_APPEND_NEWLINE
+        )
+        return self._app.response_class(body, mimetype=self.mimetype)
+
+
 app = Flask(__name__)
+app.json = OrjsonProvider(app)
 # Enable CORS so the React front-end can call this API from a different port.
 CORS(app)
 
 # Base URL for the OpenAlex API.
 OPENALEX_BASE_URL = "https://api.openalex.org"
 OPENALEX_MAILTO = "collab-finder@example.com"
+OPENALEX_ID_PREFIX = "https://openalex.org/"
+# A short (A123) or full-URL OpenAlex id; OpenAlex treats the letter case-insensitively.
+OPENALEX_ID_PATTERN = re.compile(r"(?:https?://openalex\.org/)?([A-Z])(\d+)", re.IGNORECASE)
 TRENDING_WINDOW_MONTHS = 6
 PARALLEL_MAX_WORKERS = 5
+PARALLEL_POOL_SIZE = 32
+TASK_POOL_SIZE = 16
+HEDGE_MAX_WORKERS = 16
+# A projected author query slower than this gets an unprojected query hedged alongside.
+AUTHOR_HEDGE_DELAY_SECONDS = 1.0
+# Concurrent OpenAlex requests per worker process. This caps concurrency, not a
+# rate: each gunicorn worker has its own slots, and OpenAlex limits clients to ~10 req/s.
+OPENALEX_MAX_IN_FLIGHT = 10
+# OpenAlex accepts up to 100 values in one OR filter.
+OPENALEX_BATCH_SIZE = 100
+# Consortium papers list hundreds of authors and would add k^2 pairs each.
+MAX_AUTHORS_PER_WORK = 100
+MATCH_MAX_TARGETS = 20
+# OpenAlex pages hold at most 200 works; profiles follow the cursor for a second page.
+PROFILE_WORKS_LIMIT = 400
+# Profile lookups arriving within this window share one OR-filter request.
+AUTHOR_BATCH_WINDOW_SECONDS = 0.05
+AUTHOR_BATCH_WAIT_SECONDS = 5
+OPENALEX_CACHE_MAXSIZE = 4096
+OPENALEX_CACHE_TTL_SECONDS = 60
+# Single-entity lookups such as /concepts/{id} barely change within a day.
+OPENALEX_ENTITY_CACHE_TTL_SECONDS = 24 * 60 * 60
+RESPONSE_CACHE_MAXSIZE = 1024
+RESPONSE_CACHE_TTL_SECONDS = 300
+AUTHOR_PROFILE_CACHE_TTL_SECONDS = 60 * 60
+# Marks responses built from OFFLINE_DATA; those are never cached.
+DATA_SOURCE_HEADER = "X-Data-Source"
+# Clients may reuse a cached GET body this long before revalidating its ETag.
+CLIENT_CACHE_MAX_AGE_SECONDS = 60
+
+# Projections passed as OpenAlex `select` so responses carry only the fields we read.
+CONCEPT_SELECT_FIELDS = "id,display_name,description,works_count"
+TOPIC_SELECT_FIELDS = "id,display_name,description,works_count"
+AUTHOR_SELECT_FIELDS = "id,display_name,works_count,cited_by_count,last_known_institutions"
+INSTITUTION_SELECT_FIELDS = "id,display_name,works_count,cited_by_count,geo"
+NETWORK_WORK_SELECT_FIELDS = "id,authorships"
+# OpenAlex only projects root-level fields, so nested concept/authorship keys cannot be trimmed here.
+PROFILE_WORK_SELECT_FIELDS = "id,title,publication_year,concepts,authorships,cited_by_count"
+
+
+class TTLCache:
+    """Thread-safe LRU cache whose entries expire after a fixed time-to-live."""
+
+    def __init__(self, maxsize: int, ttl: float) -> None:
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries: OrderedDict[Hashable, Tuple[float, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """Return the cached value for key, or None when missing or expired."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at <= time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: Hashable, value: Any, ttl: Optional[float] = None) -> None:
+        """Store value under key, evicting the least recently used entries."""
+        lifetime = self.ttl if ttl is None else ttl
+        with self._lock:
+            self._entries[key] = (time.monotonic() + lifetime, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop every cached entry."""
+        with self._lock:
+            self._entries.clear()
+
+
+class SingleFlight:
+    """Coalesce concurrent calls that share a key into one execution.
+
+    The first caller for a key runs the function; callers arriving while it
+    is in flight wait and receive the same result. If that run raises, each
+    waiting caller runs the function itself instead of inheriting the error.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._calls: Dict[Hashable, Tuple[threading.Event, List[Any]]] = {}
+
+    def run(self, key: Hashable, func: Callable[[], Any]) -> Any:
+        """Return func()'s result, sharing it with concurrent callers of key."""
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = (threading.Event(), [])
+        done, outcome = call
+
+        if not leader:
+            done.wait()
+            return outcome[0] if outcome else func()
 
+        try:
+            outcome.append(func())
+            return outcome[0]
+        finally:
+            with self._lock:
+                del self._calls[key]
+            done.set()
+
+
+class MicroBatcher:
+    """Gather lookups that arrive within a short window into one batched call.
+
+    The first caller of a window waits ``window`` seconds (or until
+    ``max_items`` keys are queued), then resolves every queued key with a single
+    ``fetch_many`` call. A lookup made while no other is in flight has nothing
+    to share a batch with, so it flushes at once instead of waiting. Keys
+    missing from the batch, or a failed batch, resolve to None so callers can
+    fall back to their per-item path.
+    """
+
+    def __init__(self, fetch_many: Callable[[List[str]], Optional[Dict[str, Any]]], *,
+                 window: float, max_items: int) -> None:
+        self._fetch_many = fetch_many
+        self._window = window
+        self._max_items = max_items
+        self._lock = threading.Lock()
+        self._full = threading.Event()
+        self._pending: Dict[str, Future] = {}
+        self._in_flight = 0
+
+    def get(self, key: str, timeout: Optional[float] = None) -> Optional[Any]:
+        """Return key's record from the next batch, or None if it is unavailable."""
+        with self._lock:
+            future = self._pending.get(key)
+            leader = not self._pending
+            should_wait = leader and self._in_flight > 0
+            self._in_flight += 1
+            if future is None:
+                future = self._pending[key] = Future()
+            if len(self._pending) >= self._max_items:
+                self._full.set()
 
-def fetch_openalex(endpoint: str, params: Optional[Dict] = None) -> Optional[Dict]:
-    """Call the OpenAlex API and return JSON data."""
+        try:
+            if leader:
+                if should_wait:
+                    self._full.wait(self._window)
+                self._flush()
+            return future.result(timeout)
+        except Exception:
+            return None
+        finally:
+            with self._lock:
+                self._in_flight -= 1
+
+    def _flush(self) -> None:
+        with self._lock:
+            batch, self._pending = self._pending, {}
+            self._full.clear()
+        try:
+            records = self._fetch_many(list(batch)) or {}
+        except Exception as exc:
+            for future in batch.values():
+                future.set_exception(exc)
+            return
+        for key, future in batch.items():
+            future.set_result(records.get(key))
+
+
+def build_openalex_session() -> requests.Session:
+    """Create a pooled HTTP session so OpenAlex connections are kept alive."""
+    session = requests.Session()
+    session.headers.update({
+        "User-Agent": f"CollaboratorFinder/1.0 (mailto:{OPENALEX_MAILTO})",
+        "Accept": "application/json"
+    })
+    # The polite-pool mailto is merged into every request's query string.
+    session.params = {"mailto": OPENALEX_MAILTO}
+    # Retry-After on a 429 can ask for hours and is not bounded by the request
+    # timeout, so retries use the short backoff only and callers then fall back.
+    retry = Retry(
+        total=3,
+        backoff_factor=0.3,
+        status_forcelist=(429, 500, 502, 503, 504),
+        respect_retry_after_header=False
+    )
+    adapter = HTTPAdapter(pool_connections=32, pool_maxsize=64, max_retries=retry)
+    session.mount("https://", adapter)
+    return session
+
+
+# Shared across requests and worker threads; requests.Session is safe for
+# concurrent GETs and reuses the TLS socket to api.openalex.org.
+OPENALEX_SESSION = build_openalex_session()
+# Successful OpenAlex payloads keyed by endpoint and query parameters. Cached
+# payloads are shared between callers and must be treated as read-only.
+OPENALEX_CACHE = TTLCache(OPENALEX_CACHE_MAXSIZE, OPENALEX_CACHE_TTL_SECONDS)
+# Taken around every outbound call so the worker pools below cannot flood OpenAlex.
+# A slot is held through the adapter's retries, whose backoff is kept short.
+OPENALEX_SLOTS = threading.BoundedSemaphore(OPENALEX_MAX_IN_FLIGHT)
+# Long-lived worker pools, one per nesting level: parallel_fetch workers may
+# wait on fetch_concurrently tasks, which may wait on the hedged calls in
+# fetch_author_endpoint. No pool ever waits on its own workers, so busy
+# pools only queue work and cannot deadlock.
+PARALLEL_EXECUTOR = ThreadPoolExecutor(max_workers=PARALLEL_POOL_SIZE, thread_name_prefix="openalex-fetch")
+TASK_EXECUTOR = ThreadPoolExecutor(max_workers=TASK_POOL_SIZE, thread_name_prefix="openalex-task")
+HEDGE_EXECUTOR = ThreadPoolExecutor(max_workers=HEDGE_MAX_WORKERS, thread_name_prefix="openalex-hedge")
+
+
+def fetch_openalex(endpoint: str, params: Optional[Dict] = None,
+                   sending: Optional[threading.Event] = None) -> Optional[Dict]:
+    """Call the OpenAlex API and return JSON data.
+
+    `sending` is set once the call holds an `OPENALEX_SLOTS` slot and goes on
+    the wire; cache hits never set it.
+    """
     url = f"{OPENALEX_BASE_URL}{endpoint}"
-    query_params: Dict[str, Any] = {}
-    if params:
-        query_params.update(params)
-    if "mailto" not in query_params:
-        query_params["mailto"] = OPENALEX_MAILTO
+    query_params: Dict[str, Any] = dict(params) if params else {}
+
+    cache_key = (endpoint, tuple(sorted(query_params.items())))
+    cached = OPENALEX_CACHE.get(cache_key)
+    if cached is not None:
+        return cached
+
     try:
-        headers = {
-            "User-Agent": "CollaboratorFinder/1.0 (mailto:collab-finder@example.com)",
-            "Accept": "application/json"
-        }
-        response = requests.get(url, params=query_params, timeout=15, headers=headers)
+        with OPENALEX_SLOTS:
+            if sending is not None:
+                sending.set()
+            response = OPENALEX_SESSION.get(url, params=query_params, timeout=15)
         response.raise_for_status()
-        return response.json()
+        # orjson parses the raw bytes in C, several times faster than
+        # response.json() on large /works pages.
+        payload = orjson.loads(response.content)
+        # "/authors/A123" names one entity; "/authors" is a list or search query.
+        is_entity = endpoint.count("/") > 1
+        OPENALEX_CACHE.set(cache_key, payload, OPENALEX_ENTITY_CACHE_TTL_SECONDS if is_entity else None)
+        return payload
     except requests.RequestException as exc:
         detail = getattr(exc, "response", None)
         extra = ""
@@ -57,6 +320,12 @@ def fetch_openalex(endpoint: str, params: Optional[Dict] = None) -> Optional[Dic
             extra = f" | status={detail.status_code} body={detail.text}"
         app.logger.error("OpenAlex request failed: %s%s", exc, extra)
         return None
+    except orjson.JSONDecodeError as exc:
+        app.logger.error("OpenAlex returned invalid JSON for %s: %s", endpoint, exc)
+        return None
+
+
+fetch_openalex.cache_clear = OPENALEX_CACHE.clear  # type: ignore[attr-defined]
 
 
 def extract_institution(raw_inst: Optional[Dict]) -> Optional[Dict]:
@@ -85,26 +354,53 @@ def extract_primary_institution(item: Optional[Dict[str, Any]]) -> Optional[Dict
 
 
 def fetch_author_endpoint(endpoint: str, params: Dict[str, Any]) -> Optional[Dict]:
-    """Fetch author data with retry logic for deprecated select fields."""
-    data = fetch_openalex(endpoint, params)
-    if data is not None or "select" not in params:
+    """Fetch author data with retry logic for deprecated select fields.
+
+    If the projected query has not answered `AUTHOR_HEDGE_DELAY_SECONDS`
+    after it went on the wire, the same query without `select` is hedged
+    alongside it and the first successful payload wins. Time spent queued for
+    a worker or an `OPENALEX_SLOTS` slot does not count, so a saturated process
+    does not add hedges. A projected query that fails is retried serially.
+    """
+    if "select" not in params:
+        return fetch_openalex(endpoint, params)
+
+    stripped_params = {key: value for key, value in params.items() if key != "select"}
+    sending = threading.Event()
+    primary = HEDGE_EXECUTOR.submit(fetch_openalex, endpoint, params, sending)
+    # Cache hits and failures before the send finish without setting the event.
+    primary.add_done_callback(lambda _: sending.set())
+    sending.wait()
+    hedged = False
+    try:
+        data = primary.result(timeout=AUTHOR_HEDGE_DELAY_SECONDS)
+    except FuturesTimeoutError:
+        hedged = True
+        hedge = HEDGE_EXECUTOR.submit(fetch_openalex, endpoint, stripped_params)
+        for future in as_completed([primary, hedge]):
+            data = future.result()
+            if data is not None:
+                return data
+    if data is not None:
         return data
 
     # Remove the plural field if it triggered a 403.
     select_fields = [field.strip() for field in params.get("select", "").split(",") if field.strip()]
-    if select_fields:
-        if "last_known_institutions" in select_fields:
-            fallback_fields = [field for field in select_fields if field != "last_known_institutions"]
-            if "last_known_institution" not in fallback_fields:
-                fallback_fields.append("last_known_institution")
-            fallback_params = dict(params)
-            fallback_params["select"] = ",".join(fallback_fields)
-            data = fetch_openalex(endpoint, fallback_params)
-            if data is not None:
-                return data
+    if "last_known_institutions" in select_fields:
+        fallback_fields = [field for field in select_fields if field != "last_known_institutions"]
+        if "last_known_institution" not in fallback_fields:
+            fallback_fields.append("last_known_institution")
+        fallback_params = dict(params)
+        fallback_params["select"] = ",".join(fallback_fields)
+        data = fetch_openalex(endpoint, fallback_params)
+        if data is not None:
+            return data
+
+    if hedged:
+        # The unprojected query already failed alongside the primary.
+        return None
 
     # Final attempt without any select filter.
-    stripped_params = {key: value for key, value in params.items() if key != "select"}
     return fetch_openalex(endpoint, stripped_params)
 
 
@@ -136,11 +432,17 @@ def fetch_works_endpoint(endpoint: str, params: Dict[str, Any]) -> Optional[Dict
 
 
 def fetch_institution_endpoint(endpoint: str, params: Dict[str, Any]) -> Optional[Dict]:
-    """Fetch institution data with a smaller page size fallback."""
+    """Fetch institution data; retry without select or with smaller page size."""
     data = fetch_openalex(endpoint, params)
     if data is not None:
         return data
 
+    if "select" in params:
+        params = {key: value for key, value in params.items() if key != "select"}
+        data = fetch_openalex(endpoint, params)
+        if data is not None:
+            return data
+
     per_page = params.get("per_page")
     if per_page and per_page > 50:
         reduced = dict(params)
@@ -150,6 +452,17 @@ def fetch_institution_endpoint(endpoint: str, params: Dict[str, Any]) -> Optiona
     return data
 
 
+def fetch_topic_endpoint(endpoint: str, params: Dict[str, Any]) -> Optional[Dict]:
+    """Fetch topic data; retry without select if the projection is rejected."""
+    data = fetch_openalex(endpoint, params)
+    if data is not None or "select" not in params:
+        return data
+
+    stripped_params = {key: value for key, value in params.items() if key != "select"}
+    return fetch_openalex(endpoint, stripped_params)
+
+
+@lru_cache(maxsize=512)
 def subtract_months(reference: date, months: int) -> date:
     """Return a date that is `months` before `reference` while preserving day."""
     if months <= 0:
@@ -167,7 +480,13 @@ def subtract_months(reference: date, months: int) -> date:
 
 def trending_window_strings(months: int = TRENDING_WINDOW_MONTHS) -> Dict[str, str]:
     """Compute boundary dates for recent and previous trending windows."""
-    today = date.today()
+    # The windows only move once a day, so reuse the day's formatted strings.
+    return dict(trending_window_strings_for(date.today(), months))
+
+
+@lru_cache(maxsize=64)
+def trending_window_strings_for(today: date, months: int) -> Dict[str, str]:
+    """Compute trending window boundaries relative to `today`; treat as read-only."""
     recent_start = subtract_months(today, months)
     previous_start = subtract_months(recent_start, months)
     previous_end = recent_start - timedelta(days=1)
@@ -180,6 +499,14 @@ def trending_window_strings(months: int = TRENDING_WINDOW_MONTHS) -> Dict[str, s
     }
 
 
+def canonical_openalex_id(identifier: str, kinds: str) -> Optional[str]:
+    """Return the full-URL form of an OpenAlex id of one of `kinds`, else None."""
+    match = OPENALEX_ID_PATTERN.fullmatch(identifier.strip())
+    if match is None or match.group(1).upper() not in kinds:
+        return None
+    return f"{OPENALEX_ID_PREFIX}{match.group(1).upper()}{match.group(2)}"
+
+
 def short_openalex_id(identifier: Optional[str]) -> Optional[str]:
     """Return the short-form OpenAlex identifier (e.g., C123) from a URL."""
     if not identifier:
@@ -233,15 +560,25 @@ def parallel_fetch(
     if not ordered_ids:
         return {}
 
+    # Keep at most max_workers of this call's fetches in flight on the shared
+    # pool, submitting the next identifier as each one finishes.
     results: Dict[str, Dict[str, Any]] = {}
-    worker_count = min(max_workers, len(ordered_ids))
-    with ThreadPoolExecutor(max_workers=worker_count) as executor:
-        future_map = {
-            executor.submit(worker, identifier): identifier
-            for identifier in ordered_ids
-        }
-        for future in as_completed(future_map):
-            identifier = future_map[future]
+    pending: Dict[Future, str] = {}
+    remaining = iter(ordered_ids)
+
+    def submit_next() -> None:
+        identifier = next(remaining, None)
+        if identifier is not None:
+            pending[PARALLEL_EXECUTOR.submit(worker, identifier)] = identifier
+
+    for _ in range(min(max_workers, len(ordered_ids))):
+        submit_next()
+
+    while pending:
+        done, _ = wait(pending, return_when=FIRST_COMPLETED)
+        for future in done:
+            identifier = pending.pop(future)
+            submit_next()
             try:
                 value = future.result()
             except Exception as exc:  # pragma: no cover - defensive logging
@@ -252,6 +589,51 @@ def parallel_fetch(
     return results
 
 
+def fetch_concurrently(tasks: Dict[str, Callable[[], Any]]) -> Dict[str, Any]:
+    """Run independent zero-argument fetches concurrently, keyed by task name."""
+    futures = {name: TASK_EXECUTOR.submit(task) for name, task in tasks.items()}
+    results: Dict[str, Any] = {}
+    for name, future in futures.items():
+        try:
+            value = future.result()
+        except Exception as exc:  # pragma: no cover - defensive logging
+            app.logger.error("Concurrent fetch failed for %s: %s", name, exc)
+            continue
+        if value is not None:
+            results[name] = value
+    return results
+
+
+def fetch_trending_windows(
+    group_by: str,
+    per_page: int
+) -> Tuple[Optional[Dict[str, Any]], Optional[Dict[str, Any]]]:
+    """Fetch recent and previous window group-by counts concurrently."""
+    windows = trending_window_strings()
+    recent_params = {
+        "filter": (
+            f"from_publication_date:{windows['recent_start']},"
+            f"to_publication_date:{windows['today']}"
+        ),
+        "group_by": group_by,
+        "sort": "count:desc",
+        "per_page": per_page
+    }
+    previous_params = {
+        "filter": (
+            f"from_publication_date:{windows['previous_start']},"
+            f"to_publication_date:{windows['previous_end']}"
+        ),
+        "group_by": group_by,
+        "per_page": per_page
+    }
+    payloads = fetch_concurrently({
+        "recent": lambda: fetch_works_endpoint("/works", recent_params),
+        "previous": lambda: fetch_works_endpoint("/works", previous_params)
+    })
+    return payloads.get("recent"), payloads.get("previous")
+
+
 def fetch_concept_brief(concept_id: str) -> Optional[Dict[str, Any]]:
     """Fetch summary details for a concept."""
     short_id = short_openalex_id(concept_id)
@@ -273,7 +655,7 @@ def fetch_author_brief(author_id: str) -> Optional[Dict[str, Any]]:
     short_id = short_openalex_id(author_id)
     if not short_id:
         return None
-    data = fetch_author_endpoint(f"/authors/{short_id}", {})
+    data = fetch_author_endpoint(f"/authors/{short_id}", {"select": AUTHOR_SELECT_FIELDS})
     if data is None:
         return None
     return {
@@ -285,34 +667,100 @@ def fetch_author_brief(author_id: str) -> Optional[Dict[str, Any]]:
     }
 
 
+def fetch_openalex_batch(
+    endpoint: str,
+    identifiers: Iterable[str],
+    select: str,
+    fetcher: Callable[[str, Dict[str, Any]], Optional[Dict]] = fetch_openalex
+) -> Optional[Dict[str, Dict[str, Any]]]:
+    """Fetch raw entity records via the openalex_id OR-filter, keyed by short id."""
+    short_ids = list(dict.fromkeys(
+        short_id for short_id in (short_openalex_id(identifier) for identifier in identifiers) if short_id
+    ))
+    records: Dict[str, Dict[str, Any]] = {}
+    for start in range(0, len(short_ids), OPENALEX_BATCH_SIZE):
+        chunk = short_ids[start:start + OPENALEX_BATCH_SIZE]
+        params = {
+            "filter": f"openalex_id:{'|'.join(chunk)}",
+            "per_page": OPENALEX_BATCH_SIZE,
+            "select": select
+        }
+        data = fetcher(endpoint, params)
+        if data is None:
+            return None
+        for item in data.get("results", []):
+            short_id = short_openalex_id(item.get("id"))
+            if short_id:
+                records[short_id] = item
+    return records
+
+
+def fetch_authors_batch(author_ids: Iterable[str]) -> Optional[Dict[str, Dict[str, Any]]]:
+    """Fetch raw author records in batches, keyed by short id."""
+    return fetch_openalex_batch("/authors", author_ids, AUTHOR_SELECT_FIELDS, fetch_author_endpoint)
+
+
+AUTHOR_PROFILE_BATCHER = MicroBatcher(
+    fetch_authors_batch, window=AUTHOR_BATCH_WINDOW_SECONDS, max_items=OPENALEX_BATCH_SIZE
+)
+
+
+def summarize_concept(item: Dict[str, Any]) -> Dict[str, Any]:
+    """Reduce an OpenAlex concept record to the fields trending topics render."""
+    return {
+        "id": item.get("id"),
+        "display_name": item.get("display_name"),
+        "description": item.get("description"),
+        "works_count": item.get("works_count")
+    }
+
+
+def summarize_author(item: Dict[str, Any]) -> Dict[str, Any]:
+    """Reduce an OpenAlex author record to the fields the front-end renders."""
+    return {
+        "id": item.get("id"),
+        "display_name": item.get("display_name"),
+        "works_count": item.get("works_count"),
+        "cited_by_count": item.get("cited_by_count"),
+        "last_known_institution": extract_primary_institution(item)
+    }
+
+
+def fetch_concept_details(concept_ids: List[str]) -> Dict[str, Dict[str, Any]]:
+    """Resolve concept briefs in batched lookups, falling back to one call per id."""
+    records = fetch_openalex_batch("/concepts", concept_ids, CONCEPT_SELECT_FIELDS)
+    if records is None:
+        return parallel_fetch(concept_ids, fetch_concept_brief)
+    details: Dict[str, Dict[str, Any]] = {}
+    for concept_id in concept_ids:
+        item = records.get(short_openalex_id(concept_id))
+        if item is not None:
+            details[concept_id] = summarize_concept(item)
+    return details
+
+
+def fetch_author_details(author_ids: List[str]) -> Dict[str, Dict[str, Any]]:
+    """Resolve author briefs in batched lookups, falling back to one call per id."""
+    records = fetch_authors_batch(author_ids)
+    if records is None:
+        return parallel_fetch(author_ids, fetch_author_brief)
+    details: Dict[str, Dict[str, Any]] = {}
+    for author_id in author_ids:
+        item = records.get(short_openalex_id(author_id))
+        if item is not None:
+            details[author_id] = summarize_author(item)
+    return details
+
+
 def compute_trending_topics(limit: int) -> Optional[List[Dict[str, Any]]]:
     """Compute trending topics based on recent publication growth."""
-    windows = trending_window_strings()
-    recent_params = {
-        "filter": (
-            f"from_publication_date:{windows['recent_start']},"
-            f"to_publication_date:{windows['today']}"
-        ),
-        "group_by": "concepts.id",
-        "sort": "count:desc",
-        "per_page": max(limit * 4, 50)
-    }
-    recent_payload = fetch_works_endpoint("/works", recent_params)
+    recent_payload, previous_payload = fetch_trending_windows("concepts.id", max(limit * 4, 50))
     if recent_payload is None:
         return None
     recent_counts = extract_group_counts(recent_payload)
     if not recent_counts:
         return []
 
-    previous_params = {
-        "filter": (
-            f"from_publication_date:{windows['previous_start']},"
-            f"to_publication_date:{windows['previous_end']}"
-        ),
-        "group_by": "concepts.id",
-        "per_page": max(limit * 4, 50)
-    }
-    previous_payload = fetch_works_endpoint("/works", previous_params)
     previous_counts = extract_group_counts(previous_payload) if previous_payload else {}
 
     entries: List[Dict[str, Any]] = []
@@ -348,7 +796,7 @@ def compute_trending_topics(limit: int) -> Optional[List[Dict[str, Any]]]:
     )
 
     detail_ids = [entry["id"] for entry in ranked_entries[:limit * 2]]
-    details = parallel_fetch(detail_ids, fetch_concept_brief)
+    details = fetch_concept_details(detail_ids)
 
     trending_topics: List[Dict[str, Any]] = []
     for entry in ranked_entries:
@@ -375,32 +823,15 @@ def compute_trending_topics(limit: int) -> Optional[List[Dict[str, Any]]]:
 
 def compute_trending_scientists(limit: int) -> Optional[List[Dict[str, Any]]]:
     """Compute trending authors based on recent output and citation impact."""
-    windows = trending_window_strings()
-    recent_params = {
-        "filter": (
-            f"from_publication_date:{windows['recent_start']},"
-            f"to_publication_date:{windows['today']}"
-        ),
-        "group_by": "authorships.author.id",
-        "sort": "count:desc",
-        "per_page": max(limit * 5, 75)
-    }
-    recent_payload = fetch_works_endpoint("/works", recent_params)
+    recent_payload, previous_payload = fetch_trending_windows(
+        "authorships.author.id", max(limit * 5, 75)
+    )
     if recent_payload is None:
         return None
     recent_counts = extract_group_counts(recent_payload)
     if not recent_counts:
         return []
 
-    previous_params = {
-        "filter": (
-            f"from_publication_date:{windows['previous_start']},"
-            f"to_publication_date:{windows['previous_end']}"
-        ),
-        "group_by": "authorships.author.id",
-        "per_page": max(limit * 5, 75)
-    }
-    previous_payload = fetch_works_endpoint("/works", previous_params)
     previous_counts = extract_group_counts(previous_payload) if previous_payload else {}
 
     entries: List[Dict[str, Any]] = []
@@ -423,7 +854,7 @@ def compute_trending_scientists(limit: int) -> Optional[List[Dict[str, Any]]]:
 
     entries.sort(key=lambda entry: (entry["recent_count"], entry["growth"]), reverse=True)
     candidate_ids = [entry["id"] for entry in entries[:limit * 3]]
-    author_details = parallel_fetch(candidate_ids, fetch_author_brief)
+    author_details = fetch_author_details(candidate_ids)
 
     scientists: List[Dict[str, Any]] = []
     for entry in entries:
@@ -460,21 +891,31 @@ def compute_trending_scientists(limit: int) -> Optional[List[Dict[str, Any]]]:
     return scientists[:limit]
 
 
-def fetch_author_works(author_id: str, *, per_page: int = 200) -> Optional[List[Dict[str, Any]]]:
-    """Fetch a slice of works for an author."""
+def fetch_author_works(author_id: str, *, limit: int = PROFILE_WORKS_LIMIT) -> Optional[List[Dict[str, Any]]]:
+    """Fetch up to `limit` of an author's works, newest first, following cursors."""
     short_id = short_openalex_id(author_id)
     author_filter = short_id or author_id
-    per_page = max(1, min(per_page, 200))
+    limit = max(1, limit)
     params = {
         "filter": f"authorships.author.id:{author_filter}",
-        "per_page": per_page,
+        "per_page": min(limit, 200),
         "sort": "publication_year:desc",
-        "select": "id,title,publication_year,concepts,authorships,cited_by_count"
+        "select": PROFILE_WORK_SELECT_FIELDS,
+        "cursor": "*"
     }
-    payload = fetch_works_endpoint("/works", params)
-    if payload is None:
-        return None
-    return payload.get("results", [])
+    works: List[Dict[str, Any]] = []
+    while len(works) < limit:
+        payload = fetch_works_endpoint("/works", params)
+        if payload is None:
+            # Keep the pages already fetched rather than discarding them.
+            return works or None
+        results = payload.get("results", [])
+        works.extend(results)
+        next_cursor = (payload.get("meta") or {}).get("next_cursor")
+        if not results or not next_cursor:
+            break
+        params = {**params, "cursor": next_cursor}
+    return works[:limit]
 
 
 def build_research_profile(brief: Dict[str, Any], works: List[Dict[str, Any]]) -> Dict[str, Any]:
@@ -488,6 +929,9 @@ def build_research_profile(brief: Dict[str, Any], works: List[Dict[str, Any]]) -
     coauthor_graph: Dict[str, set[str]] = {}
     works_summary: List[Dict[str, Any]] = []
     publication_years: List[int] = []
+    # Bound once: these run for every authorship and concept of every work.
+    concept_weight = concept_counts.get
+    claim_coauthor = coauthors.setdefault
 
     for work in works:
         # Publication year extraction
@@ -503,40 +947,43 @@ def build_research_profile(brief: Dict[str, Any], works: List[Dict[str, Any]]) -
         if year is not None:
             publication_years.append(year)
 
-        authors_in_work: List[Dict[str, str]] = []
+        # (id, name) tuples: far cheaper to allocate than a dict per authorship.
+        authors_in_work: List[Tuple[str, str]] = []
         for authorship in work.get("authorships", []):
             author_meta = authorship.get("author") or {}
             collaborator_id = author_meta.get("id")
             if not collaborator_id:
                 continue
             collaborator_name = author_meta.get("display_name") or collaborator_id
-            authors_in_work.append({"id": collaborator_id, "name": collaborator_name})
-
-        # Populate coauthor graph edges
-        for i in range(len(authors_in_work)):
-            for j in range(i + 1, len(authors_in_work)):
-                src = authors_in_work[i]["id"]
-                dst = authors_in_work[j]["id"]
-                coauthor_graph.setdefault(src, set()).add(dst)
-                coauthor_graph.setdefault(dst, set()).add(src)
+            authors_in_work.append((collaborator_id, collaborator_name))
+
+        # Populate coauthor graph edges: each distinct author on the work
+        # gains every other one as a neighbour, one set.update per slice.
+        work_author_ids = list(dict.fromkeys(collaborator_id for collaborator_id, _ in authors_in_work))
+        if len(work_author_ids) > 1:
+            for index, source in enumerate(work_author_ids):
+                neighbors = coauthor_graph.get(source)
+                if neighbors is None:
+                    neighbors = coauthor_graph[source] = set()
+                neighbors.update(work_author_ids[:index])
+                neighbors.update(work_author_ids[index + 1:])
 
         # Track direct coauthors
-        for collaborator in authors_in_work:
-            collaborator_id = collaborator["id"]
+        for collaborator_id, collaborator_name in authors_in_work:
             if collaborator_id in normalized_author_ids:
                 continue
-            coauthors.setdefault(collaborator_id, collaborator["name"])
+            claim_coauthor(collaborator_id, collaborator_name)
 
-        work_concepts: List[Dict[str, str]] = []
+        work_concepts: List[Tuple[str, str]] = []
         for concept in work.get("concepts", []):
             concept_id = concept.get("id")
             if not concept_id:
                 continue
             concept_name = concept.get("display_name") or concept_id
             weight = concept.get("score") or concept.get("relevance_score") or 1.0
-            concept_counts[concept_id] = concept_counts.get(concept_id, 0.0) + float(weight)
+            concept_counts[concept_id] = concept_weight(concept_id, 0.0) + float(weight)
             concept_names[concept_id] = concept_name
-            work_concepts.append({"id": concept_id, "name": concept_name})
+            work_concepts.append((concept_id, concept_name))
 
         works_summary.append({
             "id": work.get("id"),
@@ -562,40 +1009,94 @@ def build_research_profile(brief: Dict[str, Any], works: List[Dict[str, Any]]) -
         "cited_by_count": brief.get("cited_by_count"),
         "institution": brief.get("last_known_institution"),
         "concept_counts": concept_counts,
+        "concept_norm": vector_norm(concept_counts),
         "concept_names": concept_names,
         "works": works_summary,
         "coauthors": coauthors,
+        "coauthor_id_set": frozenset(coauthors),
         "coauthor_graph": coauthor_graph,
         "median_year": median_year
     }
 
 
-def collect_research_profile(author_id: str, *, works_limit: int = 200) -> Optional[Dict[str, Any]]:
-    """Gather the data needed to evaluate compatibility for an author."""
-    brief = fetch_author_brief(author_id)
-    works = fetch_author_works(author_id, per_page=works_limit) if brief is not None else None
-    if brief is None or works is None:
-        offline_brief = OFFLINE_DATA.author_profile(author_id)
-        if offline_brief is None:
-            return None
-        offline_works = OFFLINE_DATA.author_works(author_id) or []
-        return build_research_profile(offline_brief, offline_works)
-    return build_research_profile(brief, works)
+@lru_cache(maxsize=256)
+def offline_research_profile(author_id: str) -> Optional[Dict[str, Any]]:
+    """Build a profile from the offline corpus once per author; treat it as read-only."""
+    offline_brief = OFFLINE_DATA.author_profile(author_id)
+    if offline_brief is None:
+        return None
+    offline_works = OFFLINE_DATA.author_works(author_id) or []
+    return build_research_profile(offline_brief, offline_works)
+
 
+def collect_research_profiles(
+    author_ids: Iterable[str],
+    *,
+    works_limit: int = PROFILE_WORKS_LIMIT
+) -> Dict[str, Optional[Dict[str, Any]]]:
+    """Gather compatibility profiles for several authors, keyed by the given ids.
+
+    All briefs come from one batched `/authors` lookup while each author's
+    works are fetched alongside it; authors missing from the batch fall back
+    to a per-id brief, and authors without live data to the offline corpus.
+    """
+    ordered_ids = list(dict.fromkeys(author_id for author_id in author_ids if author_id))
+    if not ordered_ids:
+        return {}
 
-def cosine_similarity(vector_a: Dict[str, float], vector_b: Dict[str, float]) -> float:
-    """Compute cosine similarity between two sparse vectors."""
+    tasks: Dict[str, Callable[[], Any]] = {"briefs": lambda: fetch_authors_batch(ordered_ids)}
+    for author_id in ordered_ids:
+        tasks[f"works:{author_id}"] = partial(fetch_author_works, author_id, limit=works_limit)
+    fetched = fetch_concurrently(tasks)
+    records = fetched.get("briefs") or {}
+
+    profiles: Dict[str, Optional[Dict[str, Any]]] = {}
+    for author_id in ordered_ids:
+        works = fetched.get(f"works:{author_id}")
+        record = records.get(short_openalex_id(author_id))
+        brief = summarize_author(record) if record is not None else None
+        if brief is None and works is not None:
+            brief = fetch_author_brief(author_id)
+        if brief is None or works is None:
+            profiles[author_id] = offline_research_profile(author_id)
+        else:
+            profiles[author_id] = build_research_profile(brief, works)
+    return profiles
+
+
+def vector_norm(vector: Dict[str, float]) -> float:
+    """Return the L2 norm of a sparse vector."""
+    return math.sqrt(sum(float(value) ** 2 for value in vector.values()))
+
+
+def cosine_similarity(
+    vector_a: Dict[str, float],
+    vector_b: Dict[str, float],
+    *,
+    norm_a: Optional[float] = None,
+    norm_b: Optional[float] = None
+) -> float:
+    """Compute cosine similarity between two sparse vectors.
+
+    Pass precomputed norms (see `vector_norm`) to skip recomputing them when
+    one profile is compared against many.
+    """
     if not vector_a or not vector_b:
         return 0.0
+    # Only shared keys contribute, so walk the shorter vector.
+    smaller, larger = (vector_a, vector_b) if len(vector_a) <= len(vector_b) else (vector_b, vector_a)
+    lookup = larger.get
     dot_product = 0.0
-    for key, value in vector_a.items():
-        corresponding = vector_b.get(key)
+    for key, value in smaller.items():
+        corresponding = lookup(key)
         if corresponding is not None:
             dot_product += float(value) * float(corresponding)
     if dot_product == 0.0:
         return 0.0
-    norm_a = math.sqrt(sum(float(value) ** 2 for value in vector_a.values()))
-    norm_b = math.sqrt(sum(float(value) ** 2 for value in vector_b.values()))
+    if norm_a is None:
+        norm_a = vector_norm(vector_a)
+    if norm_b is None:
+        norm_b = vector_norm(vector_b)
     if norm_a == 0.0 or norm_b == 0.0:
         return 0.0
     return dot_product / (norm_a * norm_b)
@@ -605,11 +1106,19 @@ def compute_topic_similarity_metric(
     user_profile: Dict[str, Any],
     target_profile: Dict[str, Any]
 ) -> Tuple[float, List[str], List[str]]:
-    """Return cosine similarity and descriptive overlaps between concept vectors."""
+    """Return cosine similarity, overlap descriptions, and the top 10 shared concept ids."""
     user_vector = user_profile.get("concept_counts", {})
     target_vector = target_profile.get("concept_counts", {})
-    similarity = cosine_similarity(user_vector, target_vector)
-    overlap_ids = set(user_vector.keys()) & set(target_vector.keys())
+    if user_vector.keys().isdisjoint(target_vector.keys()):
+        # Most candidates share no concepts: similarity is zero, nothing to describe.
+        return 0.0, [], []
+    similarity = cosine_similarity(
+        user_vector,
+        target_vector,
+        norm_a=user_profile.get("concept_norm"),
+        norm_b=target_profile.get("concept_norm")
+    )
+    overlap_ids = user_vector.keys() & target_vector.keys()
 
     overlaps: List[Tuple[str, str, float, float]] = []
     for concept_id in overlap_ids:
@@ -625,51 +1134,74 @@ def compute_topic_similarity_metric(
             float(target_vector.get(concept_id, 0.0))
         ))
 
-    overlaps.sort(key=lambda item: (item[2] + item[3]), reverse=True)
+    # Only the strongest overlaps are reported or used for aligned publications.
+    top_overlaps = heapq.nlargest(10, overlaps, key=lambda item: item[2] + item[3])
     overlap_descriptions = [
         f"{name} (you {user_weight:.2f} · them {target_weight:.2f})"
-        for _, name, user_weight, target_weight in overlaps[:5]
+        for _, name, user_weight, target_weight in top_overlaps[:5]
     ]
-    ordered_overlap_ids = [concept_id for concept_id, *_ in overlaps]
+    ordered_overlap_ids = [concept_id for concept_id, *_ in top_overlaps]
     return similarity, overlap_descriptions, ordered_overlap_ids
 
 
-def merge_coauthor_graphs(profiles: Iterable[Dict[str, Any]]) -> Dict[str, set[str]]:
-    """Merge per-author coauthor graphs into a combined adjacency map."""
-    combined: Dict[str, set[str]] = {}
-    for profile in profiles:
-        graph = profile.get("coauthor_graph") or {}
-        for source, neighbors in graph.items():
-            combined.setdefault(source, set()).update(neighbors)
-    return combined
+class MergedCoauthorGraph:
+    """Read-only union of coauthor adjacency maps, resolved per lookup.
+
+    Only the nodes a search actually visits are combined, so comparing one
+    user against many targets never copies the user's whole graph.
+    """
+
+    def __init__(self, *graphs: Dict[str, set[str]]) -> None:
+        self._graphs = graphs
+
+    def get(self, node: str, default: Optional[set[str]] = None) -> Optional[set[str]]:
+        """Return the union of node's neighbours across graphs, or default."""
+        found: Optional[set[str]] = None
+        for graph in self._graphs:
+            neighbors = graph.get(node)
+            if not neighbors:
+                continue
+            found = neighbors if found is None else found | neighbors
+        return default if found is None else found
 
 
 def shortest_path_length(
-    graph: Dict[str, set[str]],
+    graph: Dict[str, set[str]] | MergedCoauthorGraph,
     start: Optional[str],
     goal: Optional[str],
     *,
     max_depth: int = 5
 ) -> Optional[int]:
-    """Compute the shortest co-author path length between two authors."""
+    """Compute the shortest co-author path length between two authors.
+
+    Co-author graphs are undirected, so this searches from both ends at once,
+    always expanding the smaller frontier by one layer; the searches meet
+    near the middle instead of exploring the full radius around `start`.
+    """
     if not start or not goal:
         return None
     if start == goal:
         return 0
 
-    queue = deque([(start, 0)])
-    visited = {start}
-
-    while queue:
-        node, depth = queue.popleft()
-        if depth >= max_depth:
-            continue
-        for neighbor in graph.get(node, []):
-            if neighbor == goal:
-                return depth + 1
-            if neighbor not in visited:
-                visited.add(neighbor)
-                queue.append((neighbor, depth + 1))
+    neighbors_of = graph.get
+    no_neighbors: set[str] = set()
+    frontier, other_frontier = {start}, {goal}
+    visited, other_visited = {start}, {goal}
+    depth = 0
+    while frontier and other_frontier and depth < max_depth:
+        if len(frontier) > len(other_frontier):
+            frontier, other_frontier = other_frontier, frontier
+            visited, other_visited = other_visited, visited
+        depth += 1
+        next_frontier: set[str] = set()
+        for node in frontier:
+            for neighbor in neighbors_of(node, no_neighbors):
+                if neighbor in other_visited:
+                    return depth
+                if neighbor not in visited:
+                    visited.add(neighbor)
+                    next_frontier.add(neighbor)
+        frontier = next_frontier
     return None
 
 
@@ -737,16 +1269,15 @@ def build_aligned_publications(
     concept_lookup = {**target_profile.get("concept_names", {}), **user_profile.get("concept_names", {})}
     for work in target_profile.get("works", []):
         concepts = work.get("concepts") or []
-        matched = [concept for concept in concepts if concept.get("id") in overlap_set]
+        matched = [(concept_id, name) for concept_id, name in concepts if concept_id in overlap_set]
         if not matched:
             continue
         publications.append({
             "title": work.get("title") or "Untitled work",
             "year": work.get("year"),
-            "concepts": [concept_lookup.get(concept.get("id"), concept.get("name")) for concept in matched]
+            "concepts": [concept_lookup.get(concept_id, name) for concept_id, name in matched]
         })
-    publications.sort(key=lambda item: (item["year"] or 0), reverse=True)
-    return publications[:5]
+    return heapq.nlargest(5, publications, key=lambda item: item["year"] or 0)
 
 
 def clamp_score(value: float) -> int:
@@ -754,6 +1285,14 @@ def clamp_score(value: float) -> int:
     return int(round(max(0.0, min(100.0, value))))
 
 
+def profile_coauthor_ids(profile: Dict[str, Any]) -> AbstractSet[str]:
+    """Return the profile's cached coauthor id set, or a view of its coauthors."""
+    cached = profile.get("coauthor_id_set")
+    if cached is not None:
+        return cached
+    return profile.get("coauthors", {}).keys()
+
+
 def compute_compatibility(
     user_profile: Dict[str, Any],
     target_profile: Dict[str, Any]
@@ -764,18 +1303,22 @@ def compute_compatibility(
     )
     topic_score = clamp_score(topic_similarity * 100)
 
-    combined_graph = merge_coauthor_graphs([user_profile, target_profile])
-    combined_graph.setdefault(user_profile.get("id"), set())
-    combined_graph.setdefault(target_profile.get("id"), set())
-    path_length = shortest_path_length(
-        combined_graph,
-        user_profile.get("id"),
-        target_profile.get("id"),
-        max_depth=6
-    )
+    user_graph = user_profile.get("coauthor_graph") or {}
+    target_graph = target_profile.get("coauthor_graph") or {}
+    # Each graph only spans its own author's works, so any path between the two
+    # authors must pass through a node both graphs contain.
+    if user_graph.keys().isdisjoint(target_graph.keys()):
+        path_length = None
+    else:
+        path_length = shortest_path_length(
+            MergedCoauthorGraph(user_graph, target_graph),
+            user_profile.get("id"),
+            target_profile.get("id"),
+            max_depth=6
+        )
     coauthor_score = clamp_score(coauthor_distance_score(path_length))
 
-    mutual_ids = set(user_profile.get("coauthors", {}).keys()) & set(target_profile.get("coauthors", {}).keys())
+    mutual_ids = profile_coauthor_ids(user_profile) & profile_coauthor_ids(target_profile)
     mutual_coauthors = [
         user_profile["coauthors"].get(author_id)
         or target_profile["coauthors"].get(author_id)
@@ -819,6 +1362,26 @@ def compute_compatibility(
     return {"breakdown": breakdown, "evidence": evidence}
 
 
+def batch_compatibility(
+    user_profile: Dict[str, Any],
+    target_profiles: Iterable[Optional[Dict[str, Any]]]
+) -> List[Dict[str, Any]]:
+    """Score one user profile against several targets, in order.
+
+    Missing target profiles yield an empty payload so results stay aligned
+    with the requested targets.
+    """
+    results: List[Dict[str, Any]] = []
+    for target_profile in target_profiles:
+        if target_profile is None:
+            results.append(empty_compatibility_payload())
+            continue
+        result = compute_compatibility(user_profile, target_profile)
+        result["target_id"] = target_profile.get("id")
+        results.append(result)
+    return results
+
+
 def empty_compatibility_payload() -> Dict[str, Any]:
     """Return a default compatibility payload with zeroed scores."""
     return {
@@ -854,19 +1417,96 @@ def extract_geo(raw_geo: Optional[Dict]) -> Dict:
     }
 
 
+def count_coauthor_pairs(
+    work_author_indices: Iterable[List[int]],
+    node_count: int
+) -> Tuple[List[Dict[int, int]], List[int]]:
+    """Count co-author pair weights and degrees over integer node indices.
+
+    Each entry of `work_author_indices` lists the node indices of one work's
+    authors. Weights accumulate in a per-node adjacency row keyed by the
+    higher neighbour index, so each pair increments a small dict owned by its
+    lower endpoint instead of one large tuple-keyed table.
+
+    Sorting a work's indices once lets `itertools.combinations` yield every
+    pair already ordered, so the inner loop runs in C with no index
+    arithmetic or comparisons. Every author on a work of `k` distinct authors
+    gains `k - 1` degree, which is added in one step per author.
+    """
+    adjacency: List[Dict[int, int]] = [{} for _ in range(node_count)]
+    degrees = [0] * node_count
+    for indices in work_author_indices:
+        pair_degree = len(indices) - 1
+        if pair_degree < 1:
+            continue
+        for index in indices:
+            degrees[index] += pair_degree
+        for lower, higher in combinations(sorted(indices), 2):
+            row = adjacency[lower]
+            row[higher] = row.get(higher, 0) + 1
+    return adjacency, degrees
+
+
+def flatten_adjacency(adjacency: List[Dict[int, int]]) -> Tuple[List[int], List[int], List[int]]:
+    """Flatten adjacency rows into parallel source/target/weight lists."""
+    sources: List[int] = []
+    targets: List[int] = []
+    weights: List[int] = []
+    for source, row in enumerate(adjacency):
+        if row:
+            sources.extend([source] * len(row))
+            targets.extend(row.keys())
+            weights.extend(row.values())
+    return sources, targets, weights
+
+
+def compact_links(sources: List[int], targets: List[int], weights: List[int]) -> Dict[str, List[int]]:
+    """Bundle parallel link arrays into the compact wire layout."""
+    return {"source": sources, "target": targets, "weight": weights}
+
+
+def compact_graph_links(graph: Dict) -> Dict:
+    """Rewrite a graph's links as parallel arrays of indices into `nodes`.
+
+    Node ids are long OpenAlex URLs. The compact layout sends each one once,
+    in `nodes`, instead of twice per edge.
+    """
+    node_index = {node["id"]: index for index, node in enumerate(graph.get("nodes", []))}
+    sources: List[int] = []
+    targets: List[int] = []
+    weights: List[int] = []
+    for link in graph.get("links", []):
+        sources.append(node_index[link["source"]])
+        targets.append(node_index[link["target"]])
+        weights.append(link.get("weight", 1))
+    return {**graph, "links": compact_links(sources, targets, weights)}
+
+
 def build_coauthor_graph(
     works: Iterable[Dict],
-    focus_author_id: Optional[str] = None
+    focus_author_id: Optional[str] = None,
+    *,
+    compact: bool = False,
+    max_authors_per_work: int = MAX_AUTHORS_PER_WORK
 ) -> Dict:
-    """Construct a co-authorship graph from a list of works."""
+    """Construct a co-authorship graph from a list of works.
+
+    With `compact`, links are emitted as parallel `source`/`target`/`weight`
+    arrays indexing into `nodes` (see `compact_graph_links`). Works with more
+    than `max_authors_per_work` authorships are skipped, which bounds the
+    quadratic pair count.
+    """
+    # Nodes accumulate as parallel arrays; node_map's insertion order is the
+    # index order, and the JSON-facing dicts are built once at the end.
     node_map: Dict[str, int] = {}
-    nodes: List[Dict] = []
-    link_weights: Counter[Tuple[str, str]] = Counter()
-    degrees: Counter[str] = Counter()
+    names: List[str] = []
+    work_author_indices: List[List[int]] = []
 
     for work in works:
         auths = work.get("authorships", [])
-        author_ids: List[str] = []
+        if len(auths) > max_authors_per_work:
+            continue
+        author_indices: List[int] = []
 
         for auth in auths:
             author = auth.get("author") or {}
@@ -875,46 +1515,125 @@ def build_coauthor_graph(
                 continue
 
             if author_id not in node_map:
-                node_map[author_id] = len(nodes)
-                nodes.append({
-                    "id": author_id,
-                    "name": author.get("display_name", author_id),
-                    "is_focus": author_id == focus_author_id
-                })
+                node_map[author_id] = len(names)
+                names.append(author.get("display_name", author_id))
+
+            author_indices.append(node_map[author_id])
 
-            author_ids.append(author_id)
+        # An author listed twice on one work must not pair with themself.
+        work_author_indices.append(list(dict.fromkeys(author_indices)))
 
-        # Update edge weights for every unique pair within a work.
-        for i in range(len(author_ids)):
-            for j in range(i + 1, len(author_ids)):
-                a, b = sorted((author_ids[i], author_ids[j]))
-                link_weights[(a, b)] += 1
-                degrees[a] += 1
-                degrees[b] += 1
+    node_ids = list(node_map)
+    adjacency, degrees = count_coauthor_pairs(work_author_indices, len(node_ids))
+    sources, targets, weights = flatten_adjacency(adjacency)
 
-    links = [{"source": a, "target": b, "weight": weight}
-             for (a, b), weight in link_weights.items()]
+    nodes = [
+        {"id": author_id, "name": name, "is_focus": author_id == focus_author_id, "degree": degree}
+        for author_id, name, degree in zip(node_ids, names, degrees)
+    ]
 
-    for node in nodes:
-        node_id = node["id"]
-        node["degree"] = degrees.get(node_id, 0)
+    links: Any
+    if compact:
+        links = compact_links(sources, targets, weights)
+    else:
+        links = [{"source": node_ids[a], "target": node_ids[b], "weight": weight}
+                 for a, b, weight in zip(sources, targets, weights)]
 
-    top_authors = sorted(nodes, key=lambda item: item.get("degree", 0), reverse=True)
+    top_authors = heapq.nlargest(10, nodes, key=lambda item: item.get("degree", 0))
 
     return {
         "nodes": nodes,
         "links": links,
         "stats": {
             "node_count": len(nodes),
-            "link_count": len(links),
+            "link_count": len(weights),
             "top_authors": [
                 {"id": item["id"], "name": item["name"], "degree": item.get("degree", 0)}
-                for item in top_authors[:10]
+                for item in top_authors
             ]
         }
     }
 
 
+# Rendered JSON bodies of GET views, keyed by path and query string.
+RESPONSE_CACHE = TTLCache(RESPONSE_CACHE_MAXSIZE, RESPONSE_CACHE_TTL_SECONDS)
+# Identical concurrent cache misses wait for one render instead of stampeding OpenAlex.
+RESPONSE_FLIGHTS = SingleFlight()
+
+
+def offline_json(payload: Any) -> Response:
+    """Serialize an offline fallback payload and tag it as such."""
+    response = jsonify(payload)
+    response.headers[DATA_SOURCE_HEADER] = "offline"
+    return response
+
+
+def revalidated(response: Response, etag: str) -> Response:
+    """Tag a cacheable response and answer 304 when the client already holds it."""
+    response.set_etag(etag)
+    response.cache_control.public = True
+    response.cache_control.max_age = CLIENT_CACHE_MAX_AGE_SECONDS
+    return response.make_conditional(request)
+
+
+def cached_json(ttl: float = RESPONSE_CACHE_TTL_SECONDS) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
+    """Serve a GET view's 200 responses from RESPONSE_CACHE for `ttl` seconds.
+
+    Concurrent misses for the same key share one render via RESPONSE_FLIGHTS.
+    Cached bodies are stored with an ETag, and a matching If-None-Match gets an
+    empty 304. Errors and offline fallbacks are not cached, so the view retries
+    OpenAlex on the next request.
+    """
+    def decorator(view: Callable[..., Any]) -> Callable[..., Any]:
+        @wraps(view)
+        def wrapper(*args: Any, **kwargs: Any) -> Response:
+            # View kwargs rather than request.path, so ids canonicalised by
+            # validate_openalex_id share one entry however the client spelled them.
+            key = (
+                request.endpoint,
+                tuple(sorted(kwargs.items())),
+                tuple(sorted(request.args.items(multi=True)))
+            )
+            cached = RESPONSE_CACHE.get(key)
+            if cached is not None:
+                body, etag = cached
+                return revalidated(Response(body, mimetype="application/json"), etag)
+
+            def render() -> Tuple[bytes, int, List[Tuple[str, str]], Optional[str]]:
+                response = app.make_response(view(*args, **kwargs))
+                rendered = response.get_data()
+                etag = None
+                if response.status_code == 200 and DATA_SOURCE_HEADER not in response.headers:
+                    etag = hashlib.blake2s(rendered, digest_size=16).hexdigest()
+                    RESPONSE_CACHE.set(key, (rendered, etag), ttl)
+                return rendered, response.status_code, list(response.headers.items()), etag
+
+            # Each caller gets its own Response built from the shared render.
+            rendered, status, headers, etag = RESPONSE_FLIGHTS.run(key, render)
+            response = Response(rendered, status=status, headers=headers)
+            return revalidated(response, etag) if etag else response
+        return wrapper
+    return decorator
+
+
+def validate_openalex_id(name: str, kinds: str) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
+    """Reject a malformed OpenAlex id argument with a 400 before any lookup.
+
+    Valid ids are passed on in canonical full-URL form, which is how the
+    offline corpus and the works' authorship ids spell them.
+    """
+    def decorator(view: Callable[..., Any]) -> Callable[..., Any]:
+        @wraps(view)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            identifier = canonical_openalex_id(kwargs[name], kinds)
+            if identifier is None:
+                return jsonify({"error": f"Invalid OpenAlex id for '{name}'"}), 400
+            kwargs[name] = identifier
+            return view(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
 @app.route("/api/health")
 def health_check():
     """Return a simple status message for health checks."""
@@ -922,24 +1641,26 @@ def health_check():
 
 
 @app.route("/api/trending/topics")
+@cached_json()
 def get_trending_topics():
     """Return topics experiencing the fastest growth in recent publications."""
     limit = request.args.get("limit", default=5, type=int)
     limit = max(1, min(limit, 20))
     topics = compute_trending_topics(limit)
     if topics is None:
-        topics = OFFLINE_DATA.trending_topics(limit) or []
+        return offline_json({"topics": OFFLINE_DATA.trending_topics(limit, copy=False) or []})
     return jsonify({"topics": topics})
 
 
 @app.route("/api/trending/scientists")
+@cached_json()
 def get_trending_scientists():
     """Return authors with the strongest recent publication momentum."""
     limit = request.args.get("limit", default=5, type=int)
     limit = max(1, min(limit, 20))
     scientists = compute_trending_scientists(limit)
     if scientists is None:
-        scientists = OFFLINE_DATA.trending_scientists(limit) or []
+        return offline_json({"scientists": OFFLINE_DATA.trending_scientists(limit, copy=False) or []})
     return jsonify({"scientists": scientists})
 
 
@@ -948,13 +1669,21 @@ def post_match():
     """Compute a compatibility profile between the user and a target researcher."""
     payload = request.get_json(silent=True) or {}
     target_id = payload.get("target_id")
-    if not target_id:
+    target_ids = payload.get("target_ids")
+    if not target_id and not target_ids:
         return jsonify({"error": "Parameter 'target_id' is required"}), 400
+    if target_ids is not None and not isinstance(target_ids, list):
+        return jsonify({"error": "Parameter 'target_ids' must be a list"}), 400
 
     user_id = payload.get("user_id") or OFFLINE_DATA.default_user_id()
 
-    user_profile = collect_research_profile(user_id)
-    target_profile = collect_research_profile(target_id)
+    if target_ids:
+        return jsonify(match_many_targets(user_id, target_ids))
+
+    # One batched brief lookup covers both authors.
+    profiles = collect_research_profiles([user_id, target_id])
+    user_profile = profiles.get(user_id)
+    target_profile = profiles.get(target_id)
 
     if user_profile is None or target_profile is None:
         app.logger.warning(
@@ -970,7 +1699,28 @@ def post_match():
     return jsonify(result)
 
 
+def match_many_targets(user_id: str, target_ids: List[Any]) -> Dict[str, Any]:
+    """Score the user against up to MATCH_MAX_TARGETS targets in one request."""
+    ordered_ids = list(dict.fromkeys(str(item) for item in target_ids if item))[:MATCH_MAX_TARGETS]
+    profiles = collect_research_profiles([user_id, *ordered_ids])
+    user_profile = profiles.get(user_id)
+
+    if user_profile is None:
+        app.logger.warning("Compatibility fallback used for user=%s", user_id)
+        results = [empty_compatibility_payload() for _ in ordered_ids]
+    else:
+        results = batch_compatibility(
+            user_profile,
+            [profiles.get(target_id) for target_id in ordered_ids]
+        )
+
+    for target_id, result in zip(ordered_ids, results):
+        result.setdefault("target_id", target_id)
+    return {"user_id": user_profile.get("id") if user_profile else user_id, "results": results}
+
+
 @app.route("/api/topics")
+@cached_json()
 def search_topics():
     """Search for topics by name."""
     query = (request.args.get("q") or request.args.get("query") or "").strip()
@@ -980,13 +1730,14 @@ def search_topics():
 
     params = {
         "search": query,
-        "per_page": min(limit, 50)
+        "per_page": min(limit, 50),
+        "select": TOPIC_SELECT_FIELDS
     }
-    data = fetch_openalex("/topics", params)
+    data = fetch_topic_endpoint("/topics", params)
     if data is None:
-        topics = OFFLINE_DATA.search_topics(query, limit)
+        topics = OFFLINE_DATA.search_topics(query, limit, copy=False)
         if topics is not None:
-            return jsonify({"topics": topics})
+            return offline_json({"topics": topics})
         return jsonify({"error": "Failed to fetch topics from OpenAlex"}), 502
 
     topics = []
@@ -1001,6 +1752,7 @@ def search_topics():
 
 
 @app.route("/api/authors")
+@cached_json()
 def search_authors():
     """Search for authors by name."""
     query = (request.args.get("q") or request.args.get("query") or "").strip()
@@ -1011,27 +1763,50 @@ def search_authors():
     params = {
         "search": query,
         "per_page": min(limit, 50),
+        "select": AUTHOR_SELECT_FIELDS
     }
     data = fetch_author_endpoint("/authors", params)
     if data is None:
-        authors = OFFLINE_DATA.search_authors(query, limit)
+        authors = OFFLINE_DATA.search_authors(query, limit, copy=False)
         if authors is not None:
-            return jsonify({"authors": authors})
+            return offline_json({"authors": authors})
         return jsonify({"error": "Failed to fetch authors from OpenAlex"}), 502
 
+    authors = [summarize_author(item) for item in data.get("results", [])]
+    return jsonify({"authors": authors})
+
+
+@app.route("/api/authors/batch")
+@cached_json()
+def get_authors_batch():
+    """Return summaries for several authors using batched OpenAlex lookups."""
+    raw_ids = [part for part in (request.args.get("ids") or "").split(",") if part.strip()]
+    if not raw_ids:
+        return jsonify({"error": "Parameter 'ids' is required"}), 400
+    if len(raw_ids) > OPENALEX_BATCH_SIZE:
+        return jsonify({"error": f"Parameter 'ids' accepts at most {OPENALEX_BATCH_SIZE} ids"}), 400
+
+    # Full-URL ids match the offline corpus keys; short ones are derived again for the OR-filter.
+    canonical_ids = [canonical_openalex_id(part, "A") for part in raw_ids]
+    if None in canonical_ids:
+        return jsonify({"error": "Invalid OpenAlex id for 'ids'"}), 400
+    author_ids = list(dict.fromkeys(canonical_ids))
+
+    records = fetch_authors_batch(author_ids)
+    if records is None:
+        return offline_json({"authors": OFFLINE_DATA.author_profiles(author_ids, copy=False)})
+
     authors = []
-    for item in data.get("results", []):
-        authors.append({
-            "id": item.get("id"),
-            "display_name": item.get("display_name"),
-            "works_count": item.get("works_count"),
-            "cited_by_count": item.get("cited_by_count"),
-            "last_known_institution": extract_primary_institution(item)
-        })
+    for author_id in author_ids:
+        item = records.get(short_openalex_id(author_id))
+        if item is not None:
+            authors.append(summarize_author(item))
     return jsonify({"authors": authors})
 
 
 @app.route("/api/authors/<path:topic_id>")
+@validate_openalex_id("topic_id", "CT")
+@cached_json()
 def get_authors_by_topic(topic_id: str):
     """Return a list of authors associated with a topic."""
     limit = request.args.get("limit", default=50, type=int)
@@ -1039,36 +1814,35 @@ def get_authors_by_topic(topic_id: str):
     params = {
         "filter": f"concepts.id:{topic_id}",
         "sort": "works_count:desc",
-        "per_page": limit
+        "per_page": limit,
+        "select": AUTHOR_SELECT_FIELDS
     }
     data = fetch_author_endpoint("/authors", params)
     if data is None:
-        authors = OFFLINE_DATA.authors_by_topic(topic_id, limit)
+        authors = OFFLINE_DATA.authors_by_topic(topic_id, limit, copy=False)
         if authors is not None:
-            return jsonify({"authors": authors})
+            return offline_json({"authors": authors})
         return jsonify({"error": "Failed to fetch authors from OpenAlex"}), 502
 
-    authors = []
-    for item in data.get("results", []):
-        authors.append({
-            "id": item.get("id"),
-            "display_name": item.get("display_name"),
-            "works_count": item.get("works_count"),
-            "cited_by_count": item.get("cited_by_count"),
-            "last_known_institution": extract_primary_institution(item)
-        })
+    authors = [summarize_author(item) for item in data.get("results", [])]
     return jsonify({"authors": authors})
 
 
 @app.route("/api/author/<path:author_id>")
+@validate_openalex_id("author_id", "A")
+@cached_json(AUTHOR_PROFILE_CACHE_TTL_SECONDS)
 def get_author_profile(author_id: str):
     """Return profile details for a single author."""
-    params: Dict[str, Any] = {}
-    data = fetch_author_endpoint(f"/authors/{author_id}", params)
+    data = None
+    if request.args.get("nobatch") != "1":
+        data = AUTHOR_PROFILE_BATCHER.get(short_openalex_id(author_id), AUTHOR_BATCH_WAIT_SECONDS)
     if data is None:
-        author = OFFLINE_DATA.author_profile(author_id)
+        params: Dict[str, Any] = {"select": AUTHOR_SELECT_FIELDS}
+        data = fetch_author_endpoint(f"/authors/{author_id}", params)
+    if data is None:
+        author = OFFLINE_DATA.author_profile(author_id, copy=False)
         if author is not None:
-            return jsonify({"author": author})
+            return offline_json({"author": author})
         return jsonify({"error": "Failed to fetch author profile from OpenAlex"}), 502
 
     author = {
@@ -1076,25 +1850,29 @@ def get_author_profile(author_id: str):
         "display_name": data.get("display_name"),
         "works_count": data.get("works_count"),
         "cited_by_count": data.get("cited_by_count"),
-        "last_known_institution": extract_institution(data.get("last_known_institution"))
+        "last_known_institution": extract_primary_institution(data)
     }
     return jsonify({"author": author})
 
 
 @app.route("/api/institutions/<path:topic_id>")
+@validate_openalex_id("topic_id", "CT")
+@cached_json()
 def get_institutions_by_topic(topic_id: str):
     """Return a list of institutions associated with a topic."""
     limit = request.args.get("limit", default=50, type=int)
+    limit = max(1, min(limit, 200))
     params = {
         "filter": f"concepts.id:{topic_id}",
         "sort": "works_count:desc",
-        "per_page": limit
+        "per_page": limit,
+        "select": INSTITUTION_SELECT_FIELDS
     }
     data = fetch_institution_endpoint("/institutions", params)
     if data is None:
-        institutions = OFFLINE_DATA.institutions_by_topic(topic_id, limit)
+        institutions = OFFLINE_DATA.institutions_by_topic(topic_id, limit, copy=False)
         if institutions is not None:
-            return jsonify({"institutions": institutions})
+            return offline_json({"institutions": institutions})
         return jsonify({"error": "Failed to fetch institutions from OpenAlex"}), 502
 
     institutions = []
@@ -1111,43 +1889,70 @@ def get_institutions_by_topic(topic_id: str):
 
 
 @app.route("/api/coauthor-network/<path:topic_id>")
+@validate_openalex_id("topic_id", "CT")
+@cached_json()
 def get_coauthor_network(topic_id: str):
     """Return a co-authorship network for works in a given topic."""
     limit_works = request.args.get("limit_works", default=200, type=int)
     limit_works = max(1, min(limit_works, 200))
+    compact = request.args.get("layout") == "compact"
+    # Callers that only render counts skip shipping the nodes and links.
+    stats_only = request.args.get("stats_only") == "1"
+    max_authors = request.args.get("max_authors_per_work", default=MAX_AUTHORS_PER_WORK, type=int)
+    max_authors = max(2, min(max_authors, MAX_AUTHORS_PER_WORK))
     params = {
         "filter": f"concepts.id:{topic_id}",
-        "per_page": limit_works
+        "per_page": limit_works,
+        "select": NETWORK_WORK_SELECT_FIELDS
     }
     data = fetch_works_endpoint("/works", params)
     if data is None:
-        network = OFFLINE_DATA.topic_network(topic_id)
+        network = OFFLINE_DATA.topic_network(topic_id, copy=False)
         if network is not None:
-            return jsonify(network)
+            if stats_only:
+                return offline_json({"stats": network["stats"]})
+            return offline_json(compact_graph_links(network) if compact else network)
         return jsonify({"error": "Failed to fetch works from OpenAlex"}), 502
 
     works = data.get("results", [])
-    return jsonify(build_coauthor_graph(works))
+    graph = build_coauthor_graph(works, compact=compact or stats_only, max_authors_per_work=max_authors)
+    return jsonify({"stats": graph["stats"]} if stats_only else graph)
 
 
 @app.route("/api/coauthor-network/author/<path:author_id>")
+@validate_openalex_id("author_id", "A")
+@cached_json()
 def get_author_coauthor_network(author_id: str):
     """Return a co-authorship network centered on a specific author."""
     limit_works = request.args.get("limit_works", default=200, type=int)
     limit_works = max(1, min(limit_works, 200))
+    compact = request.args.get("layout") == "compact"
+    # Callers that only render counts skip shipping the nodes and links.
+    stats_only = request.args.get("stats_only") == "1"
+    max_authors = request.args.get("max_authors_per_work", default=MAX_AUTHORS_PER_WORK, type=int)
+    max_authors = max(2, min(max_authors, MAX_AUTHORS_PER_WORK))
     params = {
         "filter": f"authorships.author.id:{author_id}",
-        "per_page": limit_works
+        "per_page": limit_works,
+        "select": NETWORK_WORK_SELECT_FIELDS
     }
     data = fetch_works_endpoint("/works", params)
     if data is None:
-        network = OFFLINE_DATA.author_network(author_id)
+        network = OFFLINE_DATA.author_network(author_id, copy=False)
         if network is not None:
-            return jsonify(network)
+            if stats_only:
+                return offline_json({"stats": network["stats"]})
+            return offline_json(compact_graph_links(network) if compact else network)
         return jsonify({"error": "Failed to fetch works from OpenAlex"}), 502
 
     works = data.get("results", [])
-    return jsonify(build_coauthor_graph(works, focus_author_id=author_id))
+    graph = build_coauthor_graph(
+        works,
+        focus_author_id=author_id,
+        compact=compact or stats_only,
+        max_authors_per_work=max_authors
+    )
+    return jsonify({"stats": graph["stats"]} if stats_only else graph)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,16 @@
+"""
+Gunicorn settings for serving the Flask backend in production.
+
+Run from the `backend` directory with `gunicorn app:app`. The gevent worker
+monkey-patches sockets before the app is imported, so blocking `requests`
+calls to OpenAlex yield to other clients instead of stalling the worker.
+"""
+
+import multiprocessing
+import os
+
+bind = os.environ.get("COLLABNET_BIND", "0.0.0.0:5000")
+worker_class = "gevent"
+workers = int(os.environ.get("COLLABNET_WORKERS", multiprocessing.cpu_count() * 2 + 1))
+worker_connections = 1000
+timeout = 60
@@ -110,7 +110,7 @@ const Dashboard = () => {
       try {
         const sizes = [];
         const requests = trendingScientists.map((author) =>
-          fetch(`/api/coauthor-network/author/${encodeURIComponent(author.id)}?limit_works=100`)
+          fetch(`/api/coauthor-network/author/${encodeURIComponent(author.id)}?limit_works=100&stats_only=1`)
         );
         const responses = await Promise.all(requests);
         for (let i = 0; i < responses.length; i++) {
@@ -2,6 +2,20 @@ import React, { useEffect, useState } from 'react';
 import { useNavigate, useSearchParams } from 'react-router-dom';
 import ForceGraph2D from 'react-force-graph-2d';
 
+/**
+ * Expand compact co-author links (parallel source/target/weight arrays of
+ * node indices) into the link objects expected by the force graph.
+ */
+const expandLinks = (nodes, links) => {
+  if (!links || Array.isArray(links)) return links || [];
+  const { source = [], target = [], weight = [] } = links;
+  return source.map((sourceIndex, i) => ({
+    source: nodes[sourceIndex]?.id,
+    target: nodes[target[i]]?.id,
+    weight: weight[i]
+  }));
+};
+
 /**
  * Page showing search results for topics or authors. When searching by topic,
  * it automatically retrieves the list of authors associated with the top
@@ -93,10 +107,11 @@ const SearchResults = () => {
       }
       setAuthorProfile(profile);
       // Fetch network
-      const resNet = await fetch(`/api/coauthor-network/author/${encodeURIComponent(author.id)}?limit_works=150`);
+      const resNet = await fetch(`/api/coauthor-network/author/${encodeURIComponent(author.id)}?limit_works=150&layout=compact`);
       if (resNet.ok) {
         const payload = await resNet.json();
-        setAuthorGraph({ nodes: payload.nodes || [], links: payload.links || [] });
+        const nodes = payload.nodes || [];
+        setAuthorGraph({ nodes, links: expandLinks(nodes, payload.links) });
       }
     } catch (err) {
       console.error(err);